@@ -1,111 +1,231 @@
 import sqlite3
 import csv
+import threading
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox, filedialog
-from datetime import datetime
+from collections import namedtuple
+from functools import lru_cache, partial
 from pathlib import Path
 
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; buttons just render without icons
+    Image = None
+
 # Database file
 DB_NAME = "todo.db"
 ASSETS_DIR = Path(__file__).parent / "todo_portfolio_assets"
 
-# Safe ORDER BY mapping
+# Safe ORDER BY mapping (TODO.priority: the indexed column, not the CAST alias in the SELECT)
 ORDER_MAP = {
-    "priority,created_at": "priority DESC, created_at DESC",
+    "priority,created_at": "TODO.priority DESC, created_at DESC",
     "created_at": "created_at DESC",
-    "priority": "priority DESC"
+    "priority": "TODO.priority DESC"
 }
+DEFAULT_ORDER = "priority,created_at"
+
+# Delay before a search refresh, so a burst of keystrokes triggers one query
+SEARCH_DEBOUNCE_MS = 150
 
 # ---------------- Database layer ----------------
 
+# One TODO row, in _TASK_COLUMNS order
+Task = namedtuple("Task", "id name description completed created_at due_date priority")
+
+# Prepared SQL text, kept identical across calls so sqlite3's statement cache hits
+_TASK_COLUMNS = "id, name, description, completed, created_at, due_date, CAST(COALESCE(priority, 2) AS INTEGER) AS priority"
+_FILTER_WHERE = "WHERE name LIKE ? OR description LIKE ?"
+_SEARCH_WHERE = "WHERE id IN (SELECT rowid FROM todo_fts WHERE todo_fts MATCH ?)"
+
+# One static SELECT per ORDER_MAP key, built once at import; get_tasks only picks one
+_SQL_ALL = {k: f"SELECT {_TASK_COLUMNS} FROM TODO ORDER BY {v}" for k, v in ORDER_MAP.items()}
+_SQL_FILTERED = {k: f"SELECT {_TASK_COLUMNS} FROM TODO {_FILTER_WHERE} ORDER BY {v}" for k, v in ORDER_MAP.items()}
+_SQL_SEARCH = {k: f"SELECT {_TASK_COLUMNS} FROM TODO {_SEARCH_WHERE} ORDER BY {v}" for k, v in ORDER_MAP.items()}
+SQL_GET_ALL = _SQL_ALL[DEFAULT_ORDER]
+SQL_GET_BY_ID = f"SELECT {_TASK_COLUMNS} FROM TODO WHERE id = ?"
+SQL_COUNT = "SELECT COUNT(*) FROM TODO"
+# created_at is stamped by SQLite (UTC, same format as datetime.isoformat(timespec='seconds'))
+SQL_INSERT = "INSERT INTO TODO (name, description, completed, created_at, due_date, priority) VALUES (?, ?, 0, strftime('%Y-%m-%dT%H:%M:%S', 'now'), ?, ?)"
+SQL_UPDATE = "UPDATE TODO SET name = ?, description = ?, due_date = ?, priority = ? WHERE id = ?"
+SQL_DELETE = "DELETE FROM TODO WHERE id = ?"
+SQL_TOGGLE = "UPDATE TODO SET completed = CASE WHEN completed=0 THEN 1 ELSE 0 END WHERE id = ?"
+
+# Single long-lived connection (autocommit), shared by all DB helpers
+_CONN = None
+_DB_LOCK = threading.Lock()
+_HAS_FTS = False
+
 def get_connection():
-    return sqlite3.connect(DB_NAME)
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_NAME, check_same_thread=False, isolation_level=None, cached_statements=256)
+        _CONN.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA busy_timeout=5000;
+        """)
+    return _CONN
 
 def init_db():
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS TODO (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            description TEXT,
-            completed INTEGER DEFAULT 0,
-            created_at TEXT,
-            due_date TEXT,
-            priority INTEGER DEFAULT 2
-        )
+    with _DB_LOCK:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS TODO (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                description TEXT,
+                completed INTEGER DEFAULT 0,
+                created_at TEXT,
+                due_date TEXT,
+                priority INTEGER NOT NULL DEFAULT 2
+            )
+        """)
+        # indexes matching the ORDER_MAP sort orders
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_todo_prio_created ON TODO(priority DESC, created_at DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_todo_created ON TODO(created_at DESC)")
+        _init_fts(conn)
+
+def _init_fts(conn):
+    # full-text index over name/description, kept in sync by triggers
+    global _HAS_FTS
+    try:
+        # probe the module itself: an existing todo_fts table doesn't prove this build has FTS5
+        conn.execute("CREATE VIRTUAL TABLE temp.todo_fts_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.todo_fts_probe")
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5: searches fall back to LIKE, and the sync triggers
+        # (left by an FTS5 build) must go or every write to TODO fails
+        conn.executescript("""
+            DROP TRIGGER IF EXISTS todo_fts_ai;
+            DROP TRIGGER IF EXISTS todo_fts_ad;
+            DROP TRIGGER IF EXISTS todo_fts_au;
+        """)
+        _HAS_FTS = False
+        return
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='todo_fts'").fetchone()
+    triggers = conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='trigger' AND name LIKE 'todo_fts_%'").fetchone()[0]
+    conn.executescript("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS todo_fts USING fts5(name, description, content='TODO', content_rowid='id');
+        CREATE TRIGGER IF NOT EXISTS todo_fts_ai AFTER INSERT ON TODO BEGIN
+            INSERT INTO todo_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+        END;
+        CREATE TRIGGER IF NOT EXISTS todo_fts_ad AFTER DELETE ON TODO BEGIN
+            INSERT INTO todo_fts(todo_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+        END;
+        CREATE TRIGGER IF NOT EXISTS todo_fts_au AFTER UPDATE OF name, description ON TODO BEGIN
+            INSERT INTO todo_fts(todo_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+            INSERT INTO todo_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+        END;
     """)
-    conn.commit()
-    conn.close()
+    if not exists or triggers < 3:
+        # index tasks created before the FTS table existed, or written while the triggers were dropped
+        conn.execute("INSERT INTO todo_fts(todo_fts) VALUES ('rebuild')")
+    _HAS_FTS = True
 
 def add_task(name, description, due_date, priority):
-    created_at = datetime.utcnow().isoformat(timespec='seconds')
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO TODO (name, description, completed, created_at, due_date, priority) VALUES (?, ?, 0, ?, ?, ?)",
-        (name, description, created_at, due_date if due_date else None, int(priority))
-    )
-    conn.commit()
-    conn.close()
-
-def get_tasks(filter_text="", order_by="priority DESC, created_at DESC"):
+    with _DB_LOCK:
+        conn.execute(
+            SQL_INSERT,
+            (name, description, due_date if due_date else None, int(priority))
+        )
+    _get_tasks_cached.cache_clear()
+
+def add_tasks(rows):
+    # batch insert of (name, description, due_date, priority) rows in one transaction
+    params = [(name, description, due_date if due_date else None, int(priority))
+              for name, description, due_date, priority in rows]
+    conn = get_connection()
+    with _DB_LOCK:
+        cur = conn.cursor()
+        cur.execute("BEGIN")
+        try:
+            cur.executemany(SQL_INSERT, params)
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+        cur.execute("COMMIT")
+    _get_tasks_cached.cache_clear()
+    return len(params)
+
+def fts_prefix_query(text):
+    # quote every word so user input can't break FTS5 syntax; each word matches as a prefix
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in text.split())
+
+def get_tasks(filter_text="", order_key=DEFAULT_ORDER):
+    # unknown keys fall back to the default order, so no caller text reaches the SQL
+    if order_key not in ORDER_MAP:
+        order_key = DEFAULT_ORDER
+    # strip before the cache lookup: blank filters mean "all", and " x " shares x's entry
+    return _get_tasks_cached(filter_text.strip(), order_key)
+
+# Read cache keyed by (filter, order); every write helper clears it
+@lru_cache(maxsize=64)
+def _get_tasks_cached(filter_text, order_key):
     conn = get_connection()
     cur = conn.cursor()
-    if filter_text:
+    match = fts_prefix_query(filter_text) if _HAS_FTS else ""
+    if match:
+        cur.execute(_SQL_SEARCH[order_key], (match,))
+    elif filter_text and not _HAS_FTS:
         like = f"%{filter_text}%"
-        cur.execute(
-            f"SELECT id, name, description, completed, created_at, due_date, priority FROM TODO WHERE name LIKE ? OR description LIKE ? ORDER BY {order_by}",
-            (like, like)
-        )
+        cur.execute(_SQL_FILTERED[order_key], (like, like))
     else:
-        cur.execute(f"SELECT id, name, description, completed, created_at, due_date, priority FROM TODO ORDER BY {order_by}")
-    rows = cur.fetchall()
-    conn.close()
-    return rows
+        cur.execute(_SQL_ALL[order_key])
+    return tuple(map(Task._make, cur))
 
 def get_task_by_id(task_id):
     conn = get_connection()
     cur = conn.cursor()
-    cur.execute("SELECT id, name, description, completed, created_at, due_date, priority FROM TODO WHERE id = ?", (task_id,))
+    cur.execute(SQL_GET_BY_ID, (task_id,))
     row = cur.fetchone()
-    conn.close()
-    return row
+    return Task._make(row) if row else None
 
 def update_task(task_id, name, description, due_date, priority):
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "UPDATE TODO SET name = ?, description = ?, due_date = ?, priority = ? WHERE id = ?",
-        (name, description, due_date if due_date else None, int(priority), task_id)
-    )
-    conn.commit()
-    conn.close()
+    with _DB_LOCK:
+        conn.execute(
+            SQL_UPDATE,
+            (name, description, due_date if due_date else None, int(priority), task_id)
+        )
+    _get_tasks_cached.cache_clear()
 
 def delete_task(task_id):
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM TODO WHERE id = ?", (task_id,))
-    conn.commit()
-    conn.close()
+    with _DB_LOCK:
+        conn.execute(SQL_DELETE, (task_id,))
+    _get_tasks_cached.cache_clear()
 
 def toggle_completed(task_id):
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("UPDATE TODO SET completed = CASE WHEN completed=0 THEN 1 ELSE 0 END WHERE id = ?", (task_id,))
-    conn.commit()
-    conn.close()
+    with _DB_LOCK:
+        conn.execute(SQL_TOGGLE, (task_id,))
+    _get_tasks_cached.cache_clear()
+
+def get_readonly_connection():
+    # separate read-only connection for background readers; WAL lets it run beside the writer
+    return sqlite3.connect(Path(DB_NAME).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False)
 
 def export_tasks_to_csv(filepath):
-    tasks = get_tasks("")
     try:
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(['id','name','description','completed','created_at','due_date','priority'])
-            for t in tasks:
-                writer.writerow(list(t))
-        return True, f"Exported {len(tasks)} tasks to {filepath}"
+        conn = get_readonly_connection()
+        try:
+            cur = conn.cursor()
+            # read and write inside one transaction so the export sees a single snapshot
+            cur.execute("BEGIN")
+            count = cur.execute(SQL_COUNT).fetchone()[0]
+            with open(filepath, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(['id','name','description','completed','created_at','due_date','priority'])
+                # stream rows straight from the cursor instead of materializing them
+                writer.writerows(cur.execute(SQL_GET_ALL))
+            cur.execute("COMMIT")
+        finally:
+            conn.close()
+        return True, f"Exported {count} tasks to {filepath}"
     except Exception as e:
         return False, str(e)
 
@@ -139,30 +259,33 @@ DARK = {
 PRIORITY_LIGHT = {1: "#fff1f0", 2: "#fff8e6", 3: "#effaf1"}
 PRIORITY_DARK  = {1: "#4c1111", 2: "#664900", 3: "#0f5132"}
 
-# Optional icon loader
-def load_icon_png(name):
-    path = ASSETS_DIR / f"{name}.png"
-    if path.exists():
-        try:
-            return tk.PhotoImage(file=str(path))
-        except Exception:
-            return None
-    return None
+# Option menu labels per priority, and the separator used in card/detail meta lines
+PRIORITY_LABELS = {1: "1 - High", 2: "2 - Medium", 3: "3 - Low"}
+META_SEP = "   •   "
+
+# Optional icon loader: one CTkImage per icon, shared by every button that uses it
+ICON_SIZE = (18, 18)
 
-# A small safe color-apply helper
-def safe_configure(widget, **kwargs):
+@lru_cache(maxsize=None)
+def load_icon(name):
+    path = ASSETS_DIR / f"{name}.png"
+    if Image is None or not path.exists():
+        return None
     try:
-        widget.configure(**kwargs)
+        return ctk.CTkImage(light_image=Image.open(path), size=ICON_SIZE)
     except Exception:
-        pass
+        return None
+
+# Estimated height of one task card incl. padding, until a real card can be measured
+CARD_HEIGHT = 136
+
+# Widgets of a pooled task card
+CardWidgets = namedtuple("CardWidgets", "frame title_lbl meta_lbl comp_btn")
 
 # Centralized helpers for theme/priorities
 def get_priority_bg(priority, is_dark):
-    try:
-        p = int(priority)
-    except Exception:
-        p = 2
-    return PRIORITY_DARK.get(p, DARK["card"]) if is_dark else PRIORITY_LIGHT.get(p, LIGHT["card"])
+    # priority is already an int: get_tasks casts it in SQL
+    return PRIORITY_DARK.get(priority, DARK["card"]) if is_dark else PRIORITY_LIGHT.get(priority, LIGHT["card"])
 
 def theme_text_color(is_dark):
     return DARK["text"] if is_dark else LIGHT["text"]
@@ -170,6 +293,9 @@ def theme_text_color(is_dark):
 def theme_muted_color(is_dark):
     return DARK["muted"] if is_dark else LIGHT["muted"]
 
+def theme_hover_color(is_dark):
+    return "#163144" if is_dark else "#c7ddff"
+
 # ---------------- App ----------------
 
 class ToDoApp(ctk.CTk):
@@ -180,14 +306,23 @@ class ToDoApp(ctk.CTk):
         self.minsize(900, 520)
 
         # icons (optional)
-        self.icon_check = load_icon_png("check")
-        self.icon_trash = load_icon_png("trash")
-        self.icon_calendar = load_icon_png("calendar")
+        self.icon_check = load_icon("check")
+        self.icon_trash = load_icon("trash")
+        self.icon_calendar = load_icon("calendar")
 
         # state
         self.selected_task_id = None
-        self.task_card_widgets = []  # list of tuples (id, frame)
+        self.tasks = []  # current result set, in display order
+        self.task_cards = {}  # task id -> CardWidgets, for the cards on screen
+        self._pool = []  # reusable CardWidgets skeletons; only ever grows
+        self._pool_size = 0  # pool slots in use for the current viewport height
+        self._pool_rows = []  # per pool slot: (row, is_dark) last rendered, or None
+        self._pool_shown = 0  # number of packed pool slots (always a prefix)
+        self._first_idx = 0  # index in self.tasks of the top visible card
         self.pulse_after_id = None
+        self._pulse_restore = None  # (card frame, base color) of the running pulse
+        self._search_after = None
+        self._pending_afters = set()  # ids of scheduled UI callbacks, cancelled on refresh
 
         # theming toggle
         self.dark_mode_var = tk.BooleanVar(value=False)
@@ -218,16 +353,16 @@ class ToDoApp(ctk.CTk):
         self.search_var = tk.StringVar()
         search_entry = ctk.CTkEntry(header, placeholder_text="Search tasks...", textvariable=self.search_var, width=360)
         search_entry.pack(side="left", padx=(0,8))
-        search_entry.bind("<KeyRelease>", lambda e: self.refresh_tasks())
+        search_entry.bind("<KeyRelease>", self.on_search_key)
 
         # order option menu
-        self.order_var = tk.StringVar(value="priority,created_at")
+        self.order_var = tk.StringVar(value=DEFAULT_ORDER)
         order_menu = ctk.CTkOptionMenu(header, values=list(ORDER_MAP.keys()), variable=self.order_var, command=lambda v: self.refresh_tasks())
         order_menu.pack(side="left", padx=(6,8))
-        order_menu.set("priority,created_at")
+        order_menu.set(DEFAULT_ORDER)
 
         # refresh button
-        refresh_btn = ctk.CTkButton(header, text="Refresh", command=self.refresh_tasks, width=90)
+        refresh_btn = ctk.CTkButton(header, text="Refresh", command=self.reload_tasks, width=90)
         refresh_btn.pack(side="left", padx=(0,8))
 
         # theme switch
@@ -267,8 +402,8 @@ class ToDoApp(ctk.CTk):
 
         self.label_priority = ctk.CTkLabel(form, text="Priority")
         self.label_priority.grid(row=0, column=2, sticky="w", padx=10, pady=(2,6))
-        self.priority_opt = ctk.CTkOptionMenu(form, values=["1 - High", "2 - Medium", "3 - Low"])
-        self.priority_opt.set("2 - Medium")
+        self.priority_opt = ctk.CTkOptionMenu(form, values=list(PRIORITY_LABELS.values()))
+        self.priority_opt.set(PRIORITY_LABELS[2])
         self.priority_opt.grid(row=0, column=3, padx=6, pady=(2,6))
 
         add_btn = ctk.CTkButton(form, text="Add Task", command=self.add_task_from_form, width=120)
@@ -277,9 +412,22 @@ class ToDoApp(ctk.CTk):
         # Separator
         ctk.CTkFrame(self.left_panel, height=1, fg_color="#dfeaff").pack(fill="x", padx=12, pady=(6,8))
 
-        # Scrollable task list
-        self.task_frame = ctk.CTkScrollableFrame(self.left_panel, fg_color="transparent", corner_radius=8)
-        self.task_frame.pack(fill="both", expand=True, padx=12, pady=8)
+        # Task list: virtualized, only the visible rows have card widgets
+        list_area = ctk.CTkFrame(self.left_panel, fg_color="transparent")
+        list_area.pack(fill="both", expand=True, padx=12, pady=8)
+
+        self.task_scrollbar = ctk.CTkScrollbar(list_area, command=self._on_list_scrollbar)
+        self.task_scrollbar.pack(side="right", fill="y")
+
+        self.task_frame = ctk.CTkFrame(list_area, fg_color="transparent", corner_radius=8)
+        self.task_frame.pack(side="left", fill="both", expand=True)
+        self.task_frame.pack_propagate(False)
+        self.task_frame.bind("<Configure>", self._on_list_resize)
+
+        # wheel events go to the widget under the pointer, so listen app-wide
+        self.bind_all("<MouseWheel>", self._on_list_wheel, add="+")
+        self.bind_all("<Button-4>", self._on_list_wheel, add="+")
+        self.bind_all("<Button-5>", self._on_list_wheel, add="+")
 
         # RIGHT: details panel
         self.right_panel = ctk.CTkFrame(main_container, fg_color=LIGHT["glass"], corner_radius=12, width=320)
@@ -300,8 +448,8 @@ class ToDoApp(ctk.CTk):
         self.details_due = ctk.CTkEntry(meta_row, placeholder_text="Due date (YYYY-MM-DD)")
         self.details_due.pack(side="left", fill="x", expand=True, padx=(0,8))
 
-        self.details_priority = ctk.CTkOptionMenu(meta_row, values=["1 - High", "2 - Medium", "3 - Low"])
-        self.details_priority.set("2 - Medium")
+        self.details_priority = ctk.CTkOptionMenu(meta_row, values=list(PRIORITY_LABELS.values()))
+        self.details_priority.set(PRIORITY_LABELS[2])
         self.details_priority.pack(side="right")
 
         # control buttons
@@ -339,124 +487,244 @@ class ToDoApp(ctk.CTk):
         self.entry_name.delete(0, "end")
         self.entry_desc.delete(0, "end")
         self.entry_due.delete(0, "end")
-        self.priority_opt.set("2 - Medium")
+        self.priority_opt.set(PRIORITY_LABELS[2])
+        self.refresh_tasks()
+
+    def on_search_key(self, event=None):
+        # debounce: only refresh once typing pauses
+        if self._search_after:
+            self.after_cancel(self._search_after)
+            self._pending_afters.discard(self._search_after)
+        self._search_after = self.schedule(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_after = None
+        self.refresh_tasks()
+
+    def schedule(self, ms, callback):
+        # after() that is tracked in _pending_afters until it fires or is cancelled
+        def run():
+            self._pending_afters.discard(after_id)
+            callback()
+        after_id = self.after(ms, run)
+        self._pending_afters.add(after_id)
+        return after_id
+
+    def cancel_pending_afters(self):
+        self._stop_pulse()
+        for after_id in self._pending_afters:
+            self.after_cancel(after_id)
+        self._pending_afters.clear()
+        self._search_after = None
+
+    def reload_tasks(self):
+        # Refresh button: drop cached results so changes from other connections show up
+        _get_tasks_cached.cache_clear()
         self.refresh_tasks()
 
     def refresh_tasks(self):
-        # clear old cards
-        for w in self.task_frame.winfo_children():
-            w.destroy()
-        self.task_card_widgets.clear()
+        # stale pulses/debounces must not fire on cards this refresh replaces
+        self.cancel_pending_afters()
 
         filter_text = self.search_var.get().strip()
 
-        # SAFELY map the option menu value to a valid ORDER BY clause
+        # get_tasks maps the option menu key to one of its static SELECTs
         order_key = self.order_var.get()
-        order_by_clause = ORDER_MAP.get(order_key, ORDER_MAP["priority,created_at"])
 
-        # pass the safe order clause to get_tasks
-        tasks = get_tasks(filter_text=filter_text, order_by=order_by_clause)
+        # own list copy: the cached result is shared, and single-row edits patch this one
+        self.tasks = list(get_tasks(filter_text=filter_text, order_key=order_key))
+        current_ids = {t.id: t for t in self.tasks}
 
+        # keep the scroll position, clamped to the new result size
+        self._first_idx = min(self._first_idx, self._max_first_idx())
+        self.render_visible_tasks()
+
+        # if a task was previously selected, re-show it from the rows just fetched
+        if self.selected_task_id and self.selected_task_id in current_ids:
+            self.on_task_selected_from_row(current_ids[self.selected_task_id])
+        else:
+            self.clear_details()
+
+    # ---------- Virtualized task list ----------
+    def render_visible_tasks(self):
+        # bind the card pool to tasks[first_idx:first_idx + len(pool)]; no widgets are created here
+        self._stop_pulse()
         is_dark = ctk.get_appearance_mode().lower() == "dark"
         text_color = theme_text_color(is_dark)
         muted_color = theme_muted_color(is_dark)
 
-        for t in tasks:
-            tid, name, desc, completed, created_at, due_date, priority = t
-            # priority from DB may be stored as int or text — ensure int
-            try:
-                priority = int(priority)
-            except Exception:
-                priority = 2
-
-            bg = get_priority_bg(priority, is_dark)
-
-            card = ctk.CTkFrame(self.task_frame, fg_color=bg, corner_radius=12)
-            card.pack(fill="x", pady=8, padx=8)
-            # store ref for theme updates/animations
-            self.task_card_widgets.append((tid, card))
-
-            # left: text
-            title_text = f"{name}"
-            if completed:
-                title_text = f"[COMPLETED] {title_text}"
-            lbl_title = ctk.CTkLabel(card, text=title_text, anchor="w", text_color=text_color, font=ctk.CTkFont(size=13, weight="bold"))
-            lbl_title.grid(row=0, column=0, sticky="w", padx=12, pady=(8,2))
-
-            meta = f"Priority: {priority}   •   Created: {created_at}"
-            if due_date:
-                meta += f"   •   Due: {due_date}"
-            lbl_meta = ctk.CTkLabel(card, text=meta, anchor="w", text_color=muted_color, font=ctk.CTkFont(size=10))
-            lbl_meta.grid(row=1, column=0, sticky="w", padx=12, pady=(0,8))
-
-            # right: buttons
-            btns = ctk.CTkFrame(card, fg_color="transparent")
-            btns.grid(row=0, column=1, rowspan=2, sticky="e", padx=8, pady=6)
-
-            # view/edit button selects the task and shows details
-            view_btn = ctk.CTkButton(btns, text="View", width=100, command=lambda id=tid: self.on_task_selected(id))
-            view_btn.pack(side="top", pady=(4,4))
-
-            # complete button
-            comp_text = "Mark Undone" if completed else "Mark Done"
-            comp_btn = ctk.CTkButton(btns, text=comp_text, width=120, command=lambda id=tid: self.toggle_complete_and_reload(id))
-            comp_btn.pack(side="top", pady=(4,4))
-
-            # delete small button
-            del_btn = ctk.CTkButton(btns, text="Delete", width=100, fg_color="#c44", hover_color="#a33", command=lambda id=tid: self.delete_and_reload(id))
-            del_btn.pack(side="top", pady=(4,8))
-
-            # hover bindings for lightweight hover effect
-            self._bind_hover(card, bg)
-
-        # if a task was previously selected, re-show it if still present
-        if self.selected_task_id:
-            if get_task_by_id(self.selected_task_id):
-                self.on_task_selected(self.selected_task_id)
-            else:
-                self.clear_details()
+        visible = self.tasks[self._first_idx:self._first_idx + self._pool_size]
+        self.task_cards = {}
+        for slot, task in enumerate(visible):
+            card = self._pool[slot]
+            # reconfigure only the slots whose data/theme changed
+            if self._pool_rows[slot] != (task, is_dark):
+                self._update_card(card, task, is_dark, text_color, muted_color)
+                self._pool_rows[slot] = (task, is_dark)
+            self.task_cards[task.id] = card
+
+        # shown slots are always a prefix of the pool, so packing at the tail keeps the order
+        for slot in range(self._pool_shown, len(visible)):
+            self._pool[slot].frame.pack(fill="x", pady=8, padx=8)
+        for slot in range(len(visible), self._pool_shown):
+            self._pool[slot].frame.pack_forget()
+            self._pool_rows[slot] = None
+        self._pool_shown = len(visible)
+
+        self._update_list_scrollbar()
+
+    def _row_height(self):
+        # measured card height (plus pady) once one is on screen, else the estimate
+        if self._pool_shown:
+            height = self._pool[0].frame.winfo_height()
+            if height > 1:
+                return height + 16
+        return CARD_HEIGHT
+
+    def _rows_fully_visible(self):
+        return max(1, self.task_frame.winfo_height() // self._row_height())
+
+    def _max_first_idx(self):
+        return max(0, len(self.tasks) - self._rows_fully_visible())
+
+    def _update_list_scrollbar(self):
+        total = len(self.tasks)
+        if not total:
+            self.task_scrollbar.set(0, 1)
+            return
+        last = min(total, self._first_idx + self._rows_fully_visible())
+        self.task_scrollbar.set(self._first_idx / total, last / total)
+
+    def scroll_tasks_to(self, first_idx):
+        first_idx = max(0, min(int(first_idx), self._max_first_idx()))
+        if first_idx != self._first_idx:
+            self._first_idx = first_idx
+            self.render_visible_tasks()
+
+    def _on_list_scrollbar(self, action, amount, unit=None):
+        # CTkScrollbar command protocol: ("moveto", fraction) or ("scroll", n, "units"|"pages")
+        if action == "moveto":
+            self.scroll_tasks_to(float(amount) * len(self.tasks))
+        elif action == "scroll":
+            step = int(amount) * (self._rows_fully_visible() if unit == "pages" else 1)
+            self.scroll_tasks_to(self._first_idx + step)
+
+    def _on_list_wheel(self, event):
+        # bound app-wide; only react when the pointer is over the task list
+        path, list_path = str(event.widget), str(self.task_frame)
+        if path != list_path and not path.startswith(list_path + "."):
+            return
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_tasks_to(self._first_idx - 1)
+        else:
+            self.scroll_tasks_to(self._first_idx + 1)
+
+    def _on_list_resize(self, event=None):
+        # use one card per visible row plus a partial one; grow the pool only when
+        # the viewport needs more, a smaller viewport just leaves skeletons unpacked
+        self._pool_size = self.task_frame.winfo_height() // self._row_height() + 1
+        while len(self._pool) < self._pool_size:
+            self._pool.append(self._build_card(len(self._pool)))
+            self._pool_rows.append(None)
+        self._first_idx = min(self._first_idx, self._max_first_idx())
+        self.render_visible_tasks()
+
+    def _card_texts(self, task):
+        # priority already comes back as an int (CAST in the SELECT)
+        title_text = f"[COMPLETED] {task.name}" if task.completed else task.name
+        if task.due_date:
+            meta = META_SEP.join((f"Priority: {task.priority}", f"Created: {task.created_at}", f"Due: {task.due_date}"))
+        else:
+            meta = META_SEP.join((f"Priority: {task.priority}", f"Created: {task.created_at}"))
+        comp_text = "Mark Undone" if task.completed else "Mark Done"
+        return task.priority, title_text, meta, comp_text
+
+    def _build_card(self, slot):
+        # empty card skeleton for pool slot `slot`; _update_card fills it in
+        card = ctk.CTkFrame(self.task_frame, fg_color="transparent", corner_radius=12)
+
+        # left: text
+        lbl_title = ctk.CTkLabel(card, text="", anchor="w", font=ctk.CTkFont(size=13, weight="bold"))
+        lbl_title.grid(row=0, column=0, sticky="w", padx=12, pady=(8,2))
+
+        lbl_meta = ctk.CTkLabel(card, text="", anchor="w", font=ctk.CTkFont(size=10))
+        lbl_meta.grid(row=1, column=0, sticky="w", padx=12, pady=(0,8))
+
+        # right: buttons
+        btns = ctk.CTkFrame(card, fg_color="transparent")
+        btns.grid(row=0, column=1, rowspan=2, sticky="e", padx=8, pady=6)
+
+        # view/edit button selects the task and shows details
+        view_btn = ctk.CTkButton(btns, text="View", width=100, command=partial(self._on_card_view, slot))
+        view_btn.pack(side="top", pady=(4,4))
+
+        # complete button
+        comp_btn = ctk.CTkButton(btns, text="", width=120, image=self.icon_check, command=partial(self._on_card_command, slot, self.toggle_complete_and_reload))
+        comp_btn.pack(side="top", pady=(4,4))
+
+        # delete small button
+        del_btn = ctk.CTkButton(btns, text="Delete", width=100, image=self.icon_trash, fg_color="#c44", hover_color="#a33", command=partial(self._on_card_command, slot, self.delete_and_reload))
+        del_btn.pack(side="top", pady=(4,8))
+
+        # hover bindings for lightweight hover effect
+        self._bind_hover(card, LIGHT["card"])
+
+        return CardWidgets(card, lbl_title, lbl_meta, comp_btn)
+
+    def _on_card_view(self, slot):
+        # the slot already holds the row on screen, no need to re-read it by id
+        row = self._pool_rows[slot]
+        if row:
+            self.on_task_selected_from_row(row[0])
+
+    def _on_card_command(self, slot, action):
+        # pool slots show different tasks as the list scrolls; resolve id and list index at click time
+        row = self._pool_rows[slot]
+        if row:
+            action(row[0].id, self._first_idx + slot)
+
+    def _update_card(self, card, task, is_dark, text_color, muted_color):
+        priority, title_text, meta, comp_text = self._card_texts(task)
+        bg = get_priority_bg(priority, is_dark)
+        card.frame.configure(fg_color=bg)
+        card.frame._prev_bg = bg
+        card.title_lbl.configure(text=title_text, text_color=text_color)
+        card.meta_lbl.configure(text=meta, text_color=muted_color)
+        card.comp_btn.configure(text=comp_text)
 
     def _bind_hover(self, widget, base_bg):
         # simple hover: on enter, set slightly lighter hover color; on leave, restore
-        hover_color = "#c7ddff" if ctk.get_appearance_mode().lower() == "light" else "#163144"
         def on_enter(e):
+            # looked up per event: pooled cards outlive theme toggles
+            hover_color = theme_hover_color(ctk.get_appearance_mode().lower() == "dark")
             try:
                 widget._prev_bg = widget.cget("fg_color")
             except Exception:
                 widget._prev_bg = base_bg
-            safe_configure(widget, fg_color=hover_color)
+            widget.configure(fg_color=hover_color)
         def on_leave(e):
-            safe_configure(widget, fg_color=getattr(widget, "_prev_bg", base_bg))
+            widget.configure(fg_color=getattr(widget, "_prev_bg", base_bg))
         widget.bind("<Enter>", on_enter)
         widget.bind("<Leave>", on_leave)
 
-    def on_task_selected(self, task_id):
-        task = get_task_by_id(task_id)
-        if not task:
-            return
-        self.selected_task_id = task_id
-        _, name, desc, completed, created_at, due_date, priority = task
+    def on_task_selected_from_row(self, task):
+        self.selected_task_id = task.id
         # populate details panel
         self.details_name.delete(0, "end")
-        self.details_name.insert(0, name)
+        self.details_name.insert(0, task.name)
         self.details_desc.configure(state="normal")
         self.details_desc.delete("1.0", "end")
-        self.details_desc.insert("1.0", desc or "")
+        self.details_desc.insert("1.0", task.description or "")
         self.details_desc.configure(state="normal")
         self.details_due.delete(0, "end")
-        if due_date:
-            self.details_due.insert(0, due_date)
+        if task.due_date:
+            self.details_due.insert(0, task.due_date)
         # ensure priority is set with label "N - Label"
-        try:
-            p = int(priority)
-        except Exception:
-            p = 2
-        label = f"{p} - {'High' if p==1 else 'Medium' if p==2 else 'Low'}"
-        self.details_priority.set(label)
-        meta = f"Created: {created_at}   •   Completed: {'Yes' if completed else 'No'}"
+        self.details_priority.set(PRIORITY_LABELS.get(task.priority, PRIORITY_LABELS[2]))
+        meta = META_SEP.join((f"Created: {task.created_at}", f"Completed: {'Yes' if task.completed else 'No'}"))
         self.details_meta.configure(text=meta)
         # animate selected card
-        self.animate_selection(task_id)
+        self.animate_selection(task.id)
 
     def save_selected_task(self):
         if not self.selected_task_id:
@@ -489,19 +757,35 @@ class ToDoApp(ctk.CTk):
             self.clear_details()
             self.refresh_tasks()
 
-    def delete_and_reload(self, task_id):
+    def delete_and_reload(self, task_id, idx=None):
         if messagebox.askyesno("Confirm", "Delete this task?"):
             delete_task(task_id)
             if self.selected_task_id == task_id:
                 self.clear_details()
-            self.refresh_tasks()
-
-    def toggle_complete_and_reload(self, task_id):
+            # drop just this row; only the visible slots from it down get reconfigured
+            if not self._is_task_at(task_id, idx):
+                self.refresh_tasks()
+                return
+            del self.tasks[idx]
+            self._first_idx = min(self._first_idx, self._max_first_idx())
+            self.render_visible_tasks()
+
+    def toggle_complete_and_reload(self, task_id, idx=None):
         toggle_completed(task_id)
         # Desmarcamos siempre para que no quede la tarjeta "seleccionada"
         if self.selected_task_id == task_id:
             self.clear_details()
-        self.refresh_tasks()
+        # no sort order depends on `completed`, so patch the one row instead of re-querying the list
+        row = get_task_by_id(task_id)
+        if row is None or not self._is_task_at(task_id, idx):
+            self.refresh_tasks()
+            return
+        self.tasks[idx] = row
+        self.render_visible_tasks()
+
+    def _is_task_at(self, task_id, idx):
+        # idx comes from the clicked card (first_idx + slot); callers without one fall back to a refresh
+        return idx is not None and 0 <= idx < len(self.tasks) and self.tasks[idx].id == task_id
 
     def clear_details(self):
         self.selected_task_id = None
@@ -510,7 +794,7 @@ class ToDoApp(ctk.CTk):
         self.details_desc.delete("1.0", "end")
         self.details_desc.configure(state="disabled")
         self.details_due.delete(0, "end")
-        self.details_priority.set("2 - Medium")
+        self.details_priority.set(PRIORITY_LABELS[2])
         self.details_meta.configure(text="")
 
     # ---------- Theme control (apply theme to all) ----------
@@ -525,29 +809,26 @@ class ToDoApp(ctk.CTk):
     def apply_theme(self, palette):
         is_dark = palette is DARK
 
-        # apply to main window and base frames
-        safe_configure(self.root_frame, fg_color=palette["window_bg"])
-
-        # left/right known panels
-        safe_configure(self.left_panel, fg_color=palette.get("panel", palette.get("glass")))
-        safe_configure(self.right_panel, fg_color=palette.get("glass"))
-        safe_configure(self.task_frame, fg_color=palette.get("panel", palette.get("glass")))
-
-        # update many textual widgets to correct text color
         text_color = theme_text_color(is_dark)
         muted = theme_muted_color(is_dark)
         try:
-            safe_configure(self.title_label, text_color=text_color)
-        except Exception:
-            pass
-        try:
-            safe_configure(self.label_taskname, text_color=text_color)
-            safe_configure(self.label_desc, text_color=text_color)
-            safe_configure(self.label_due, text_color=text_color)
-            safe_configure(self.label_priority, text_color=text_color)
-            safe_configure(self.details_title, text_color=text_color)
-            safe_configure(self.details_meta, text_color=muted)
-        except Exception:
+            # apply to main window and base frames
+            self.root_frame.configure(fg_color=palette["window_bg"])
+
+            # left/right known panels
+            self.left_panel.configure(fg_color=palette.get("panel", palette.get("glass")))
+            self.right_panel.configure(fg_color=palette.get("glass"))
+            self.task_frame.configure(fg_color=palette.get("panel", palette.get("glass")))
+
+            # update many textual widgets to correct text color
+            self.title_label.configure(text_color=text_color)
+            self.label_taskname.configure(text_color=text_color)
+            self.label_desc.configure(text_color=text_color)
+            self.label_due.configure(text_color=text_color)
+            self.label_priority.configure(text_color=text_color)
+            self.details_title.configure(text_color=text_color)
+            self.details_meta.configure(text_color=muted)
+        except tk.TclError:
             pass
 
         # rebuild tasks so cards use correct colors for the theme
@@ -556,18 +837,13 @@ class ToDoApp(ctk.CTk):
     # ---------- Small animations ----------
     def animate_selection(self, task_id):
         # cancel previous pulse
-        if self.pulse_after_id:
-            self.after_cancel(self.pulse_after_id)
-            self.pulse_after_id = None
+        self._stop_pulse()
 
         # find the target card
-        target = None
-        for tid, widget in self.task_card_widgets:
-            if tid == task_id:
-                target = widget
-                break
-        if not target:
+        card = self.task_cards.get(task_id)
+        if not card:
             return
+        target = card.frame
 
         is_dark = ctk.get_appearance_mode().lower() == "dark"
         base = target.cget("fg_color")
@@ -576,24 +852,51 @@ class ToDoApp(ctk.CTk):
         interval = 80
 
         def step(i=0):
-            if i % 2 == 0:
-                safe_configure(target, fg_color=pulse_color)
-            else:
-                safe_configure(target, fg_color=base)
+            try:
+                target.configure(fg_color=pulse_color if i % 2 == 0 else base)
+            except tk.TclError:
+                # card widget is gone (e.g. the window is closing)
+                self.pulse_after_id = None
+                self._pulse_restore = None
+                return
             next_i = i + 1
             if next_i <= steps:
-                self.pulse_after_id = self.after(interval, lambda: step(next_i))
+                self.pulse_after_id = self.schedule(interval, partial(step, next_i))
             else:
                 self.pulse_after_id = None
+                self._pulse_restore = None
 
+        self._pulse_restore = (target, base)
         step(0)
 
+    def _stop_pulse(self):
+        # cancel a running pulse and put its card back to the base color
+        if self.pulse_after_id:
+            self.after_cancel(self.pulse_after_id)
+            self._pending_afters.discard(self.pulse_after_id)
+            self.pulse_after_id = None
+        if self._pulse_restore:
+            target, base = self._pulse_restore
+            self._pulse_restore = None
+            try:
+                target.configure(fg_color=base)
+            except tk.TclError:
+                pass
+
     # ---------- Export ----------
     def export_csv_dialog(self):
         path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files","*.csv")])
         if not path:
             return
+        # write the file off the Tk thread; report back on the main loop
+        threading.Thread(target=self._export_worker, args=(path,), daemon=True).start()
+
+    def _export_worker(self, path):
         ok, msg = export_tasks_to_csv(path)
+        # plain after(): this runs on the worker thread and must not be cancelled by a refresh
+        self.after(0, lambda: self._export_done(ok, msg))
+
+    def _export_done(self, ok, msg):
         if ok:
             messagebox.showinfo("Export", msg)
         else: